@@ -0,0 +1,221 @@
+"""Core model classes for structeasy.
+
+Nodes and elements imported from a gmsh .geo file are stored in plain
+dictionaries (``nodes_db`` / ``elements_db``) keyed by their gmsh entity
+number.  The classes below are deliberately thin: they carry geometry,
+the physical-group tag and two containers that the analysis routines
+fill in later.
+"""
+
+from math import hypot
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to plain Python/NumPy
+    njit = None
+    prange = range
+
+# Default vecxy: the global z axis. A tuple (not a list) so the shared
+# default cannot be mutated by a caller, and plain floats so the scalar
+# kernel sees no numpy.
+_Z_AXIS = (0.0, 0.0, 1.0)
+
+
+def _vecxz(x0, y0, z0, x1, y1, z1, vx, vy, vz):
+    # cross(node_j - node_i, vecxy), inlined so the JIT sees only
+    # scalar arithmetic.
+    ax = x1 - x0
+    ay = y1 - y0
+    az = z1 - z0
+    return (ay * vz - az * vy, az * vx - ax * vz, ax * vy - ay * vx)
+
+
+def _vecxz_batch(p1, p2, vx, vy, vz):
+    out = np.empty((p1.shape[0], 3))
+    for k in prange(p1.shape[0]):
+        ax = p2[k, 0] - p1[k, 0]
+        ay = p2[k, 1] - p1[k, 1]
+        az = p2[k, 2] - p1[k, 2]
+        out[k, 0] = ay * vz - az * vy
+        out[k, 1] = az * vx - ax * vz
+        out[k, 2] = ax * vy - ay * vx
+    return out
+
+
+if njit is not None:
+    _vecxz = njit(cache=True)(_vecxz)
+    _vecxz_batch = njit(parallel=True, cache=True)(_vecxz_batch)
+else:
+    def _vecxz_batch(p1, p2, vx, vy, vz):
+        return np.cross(p2 - p1, np.array([vx, vy, vz]))
+
+
+def vecxz_batch(p1, p2, vecxy=_Z_AXIS):
+    """Compute the local xz vector of many elements at once.
+
+    Parameters
+    ----------
+    p1, p2 : array_like, shape (N, 3)
+        Coordinates of the i and j end nodes.
+    vecxy : sequence of 3 floats, optional
+        Vector spanning the local xy plane, global z by default.
+
+    Returns
+    -------
+    numpy.ndarray
+        The xz vectors, shape (N, 3).  JIT-compiled and parallel when
+        numba is installed.
+    """
+    vx, vy, vz = vecxy
+    return _vecxz_batch(np.asarray(p1, dtype=np.float64),
+                        np.asarray(p2, dtype=np.float64), vx, vy, vz)
+
+
+class _Tagged:
+    """State shared by nodes and elements: the physical-group tag, the
+    entity kind and the containers the analysis routines fill in.
+
+    Large models allocate one instance per gmsh entity, so the slotted
+    layout matters: attribute access becomes an offset lookup and each
+    instance loses its roughly 100-byte __dict__.
+    """
+
+    __slots__ = ('tag', 'eltype', '_container', '_data_analysis')
+
+    def __init__(self, tag, eltype):
+        self.tag = tag
+        self.eltype = eltype
+        # The analysis containers are rarely touched by the geometry and
+        # plotting paths, so two empty lists per entity would be pure
+        # waste; they materialize on first access instead.
+        self._container = None
+        self._data_analysis = None
+
+    @property
+    def container(self):
+        if self._container is None:
+            self._container = []
+        return self._container
+
+    @container.setter
+    def container(self, value):
+        self._container = value
+
+    @property
+    def data_analysis(self):
+        if self._data_analysis is None:
+            self._data_analysis = []
+        return self._data_analysis
+
+    @data_analysis.setter
+    def data_analysis(self, value):
+        self._data_analysis = value
+
+
+class Node(_Tagged):
+    """A single model node.
+
+    Parameters
+    ----------
+    nnumber : int
+        gmsh point number, also the key used in ``nodes_db``.
+    x, y, z : float
+        Cartesian coordinates.
+    tag : int
+        Physical-group tag, -1 when the node belongs to no group.
+
+    The coordinates are stored once, as the float64 array ``coord``;
+    ``x``/``y``/``z`` are read-only views into it, so consumers that
+    need an ndarray (``vecxz``, ``compute_lengths``, ``plot_model``)
+    no longer convert a Python list on every access.
+    """
+
+    __slots__ = ('nnumber', 'coord')
+
+    def __init__(self, nnumber, x, y, z, tag):
+        super().__init__(tag, 0)
+        self.nnumber = nnumber
+        self.coord = np.array([x, y, z], dtype=np.float64)
+
+    @property
+    def x(self):
+        return self.coord[0]
+
+    @property
+    def y(self):
+        return self.coord[1]
+
+    @property
+    def z(self):
+        return self.coord[2]
+
+
+class Element(_Tagged):
+    """A two-node line element.
+
+    Parameters
+    ----------
+    enumber : int
+        gmsh line number, also the key used in ``elements_db``.
+    nodes : list of Node
+        End nodes, i and j.
+    tag : int
+        Physical-group tag, -1 when the element belongs to no group.
+    """
+
+    __slots__ = ('enumber', 'nodes', 'nodei', 'nodej')
+
+    def __init__(self, enumber, nodes, tag):
+        super().__init__(tag, 1)
+        self.enumber = enumber
+        self.nodes = nodes
+        self.nodei = nodes[0]
+        self.nodej = nodes[1]
+
+    def length(self):
+        """Return the distance between the end nodes."""
+        c0 = self.nodes[0].coord
+        c1 = self.nodes[1].coord
+        return hypot(c1[0] - c0[0], c1[1] - c0[1], c1[2] - c0[2])
+
+    def vecxz(self, vecxy=None):
+        """Return the local xz vector used by OpenSees geomTransf."""
+        c0 = self.nodes[0].coord
+        c1 = self.nodes[1].coord
+        vx, vy, vz = _Z_AXIS if vecxy is None else vecxy
+        x, y, z = _vecxz(float(c0[0]), float(c0[1]), float(c0[2]),
+                         float(c1[0]), float(c1[1]), float(c1[2]),
+                         float(vx), float(vy), float(vz))
+        return [x, y, z]
+
+
+def compute_lengths(elements_db, nodes_db=None):
+    """Return the lengths of every element in ``elements_db`` at once.
+
+    Calling :meth:`Element.length` in a Python loop pays interpreter and
+    attribute-lookup overhead per element; for whole-model diagnostics it
+    is much cheaper to gather the end-node coordinates into two (N, 3)
+    arrays and let NumPy do a single vectorized norm.
+
+    Parameters
+    ----------
+    elements_db : dict of Element
+        Elements to measure, in dict order.
+    nodes_db : dict of Node, optional
+        Accepted for symmetry with the other whole-model helpers; the
+        coordinates are read from the elements' own node references.
+
+    Returns
+    -------
+    numpy.ndarray
+        Lengths, shape (N,), ordered like ``elements_db.values()``.
+    """
+    n = len(elements_db)
+    p1 = np.empty((n, 3))
+    p2 = np.empty((n, 3))
+    for k, element in enumerate(elements_db.values()):
+        p1[k] = element.nodes[0].coord
+        p2[k] = element.nodes[1].coord
+    return np.linalg.norm(p2 - p1, axis=1)
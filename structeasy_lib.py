@@ -0,0 +1,260 @@
+"""Model import, visualization and OpenSees helpers for structeasy.
+
+The typical workflow is::
+
+    nodes_db, elements_db = import_geofile('frame.geo')
+    plot_model(nodes_db, elements_db)
+    start_model(ndm=3, ndf=6)
+    create_nodes(nodes_db)
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import matplotlib.pyplot as plt
+from matplotlib import cm
+
+from structeasy_class import Node, Element
+
+# gmsh and OpenSees are only needed by the functions that drive them;
+# importing them lazily per call would pay the import-machinery lookup
+# on every invocation, so they are resolved once here instead.
+try:
+    import gmsh
+except ImportError:
+    gmsh = None
+
+try:
+    import openseespy.opensees as ops
+except ImportError:
+    ops = None
+
+
+def _physical_group_lookup(model):
+    """Map (dim, entity) to its physical-group tag, fetching each
+    group's entity list from gmsh exactly once.
+
+    Membership is resolved through the dict's hash lookup rather than a
+    scan of the gmsh result lists; when an entity belongs to several
+    groups, the group gmsh reports last wins, matching the behavior of
+    the original per-entity scan.
+    """
+    tag_of = {}
+    for dim, tag in model.getPhysicalGroups():
+        for entity in model.getEntitiesForPhysicalGroup(dim, tag).tolist():
+            tag_of[(dim, entity)] = tag
+    return tag_of
+
+
+def import_geofile(filepath):
+    """Import a gmsh .geo file and return (nodes_db, elements_db).
+
+    Every geometry point becomes a :class:`Node` and every line a
+    two-node :class:`Element`.  Physical-group tags are attached so the
+    databases can be filtered later (supports, sections, loads...).
+    """
+    if gmsh is None:
+        raise ImportError('gmsh is required for import_geofile')
+
+    gmsh.initialize()
+    gmsh.open(filepath)
+    model = gmsh.model
+    model.geo.synchronize()
+
+    # Invert the physical-group map once: querying gmsh per node and per
+    # element would cost one round-trip per (entity, group) pair, which
+    # dominates the import of any nontrivial .geo file.
+    tag_of = _physical_group_lookup(model)
+
+    # Collect all point coordinates into one (N, 3) buffer up front; the
+    # per-point .tolist() conversions and throwaway gmsh result arrays
+    # are the expensive part, not the arithmetic.
+    points = [point[1] for point in model.getEntities(0)]
+    coords = np.empty((len(points), 3))
+    for k, nnumber in enumerate(points):
+        coords[k] = model.getValue(0, nnumber, ())
+
+    nodes_db = {}
+    for k, nnumber in enumerate(points):
+        tag = tag_of.get((0, nnumber), -1)
+        nodes_db[nnumber] = Node(nnumber, coords[k, 0], coords[k, 1],
+                                 coords[k, 2], tag)
+
+    elements_db = {}
+    for line in model.getEntities(1):
+        enumber = line[1]
+        boundary = model.getBoundary([(1, enumber)])
+        element_nodes = [nodes_db[abs(point[1])] for point in boundary]
+        tag = tag_of.get((1, enumber), -1)
+        elements_db[enumber] = Element(enumber, element_nodes, tag)
+
+    gmsh.finalize()
+    return nodes_db, elements_db
+
+
+def plot_model(nodes_db, elements_db, show_numbers=True, show_tags=False,
+               color_by_tag=False, save_html=False, filename='model.html'):
+    """Draw the model with Plotly.
+
+    Nodes are plotted as markers (optionally labelled with their number
+    and tag), elements as 3D lines with their number at midspan.  When
+    ``color_by_tag`` is true, nodes and elements sharing a physical
+    group get the same color.  With ``save_html`` the figure is written
+    to ``filename`` instead of being shown.
+    """
+    node_tags = np.fromiter((node.tag for node in nodes_db.values()),
+                            dtype=np.int64, count=len(nodes_db))
+    elem_tags = np.fromiter((element.tag for element in elements_db.values()),
+                            dtype=np.int64, count=len(elements_db))
+    tags = np.unique(np.concatenate([node_tags, elem_tags]))
+    tags = tags[tags != -1]
+    tag_color_map = {}
+    palette = None
+    if color_by_tag and tags.size:
+        palette = (cm.rainbow(np.linspace(0, 1, tags.size))[:, :3]
+                   * 255).astype(np.uint8)
+        tag_color_map = {int(tag): 'rgb({},{},{})'.format(*rgb)
+                         for tag, rgb in zip(tags, palette)}
+
+    fig = go.Figure()
+
+    # Gather every end-node coordinate once into a (N, 2, 3) array;
+    # the traces below are built from slices of it instead of repeated
+    # passes over node attributes.
+    n_elements = len(elements_db)
+    ends = np.empty((n_elements, 2, 3))
+    for k, element in enumerate(elements_db.values()):
+        ends[k, 0] = element.nodes[0].coord
+        ends[k, 1] = element.nodes[1].coord
+
+    # One trace per element would bloat the figure JSON and the browser
+    # render time by orders of magnitude on large models; instead all
+    # segments sharing a color go into a single trace, padded with a NaN
+    # row between elements (Plotly's way to break a line).
+    def element_trace(segments, color):
+        padded = np.empty((segments.shape[0], 3, 3))
+        padded[:, :2] = segments
+        padded[:, 2] = np.nan
+        return go.Scatter3d(x=padded[..., 0].ravel(),
+                            y=padded[..., 1].ravel(),
+                            z=padded[..., 2].ravel(),
+                            mode='lines',
+                            line=dict(color=color, width=4),
+                            showlegend=False)
+
+    if color_by_tag:
+        for tag in np.unique(elem_tags):
+            mask = elem_tags == tag
+            fig.add_trace(element_trace(ends[mask],
+                                        tag_color_map.get(int(tag), 'blue')))
+    elif n_elements:
+        fig.add_trace(element_trace(ends, 'blue'))
+
+    if show_numbers and n_elements:
+        mids = ends.mean(axis=1)
+        fig.add_trace(go.Scatter3d(
+            x=mids[:, 0], y=mids[:, 1], z=mids[:, 2],
+            mode='text',
+            text=[str(enumber) for enumber in elements_db],
+            textfont=dict(color='green'),
+            showlegend=False))
+
+    # Map node tags to palette rows with searchsorted instead of a dict
+    # lookup per node; untagged (-1) nodes fall back to red.
+    if color_by_tag and tags.size:
+        idx = np.minimum(np.searchsorted(tags, node_tags), tags.size - 1)
+        tagged = tags[idx] == node_tags
+        node_color = ['rgb({},{},{})'.format(*palette[i]) if ok else 'red'
+                      for i, ok in zip(idx, tagged)]
+    else:
+        node_color = 'red'
+    # Pick the label format once instead of re-testing show_tags per node.
+    if not show_numbers:
+        node_text = None
+    elif show_tags:
+        node_text = [f'{nnumber}<br>Tag: {node.tag}'
+                     for nnumber, node in nodes_db.items()]
+    else:
+        node_text = [str(nnumber) for nnumber in nodes_db]
+    fig.add_trace(go.Scatter3d(
+        x=[node.x for node in nodes_db.values()],
+        y=[node.y for node in nodes_db.values()],
+        z=[node.z for node in nodes_db.values()],
+        mode='markers+text' if show_numbers else 'markers',
+        marker=dict(size=4, color=node_color),
+        text=node_text,
+        showlegend=False))
+
+    fig.update_layout(scene=dict(aspectmode='data'))
+    if save_html:
+        # Serialize the figure exactly once: show() followed by
+        # write_html would run the whole JSON encode twice. The saved
+        # page is self-contained and opens in any browser.
+        with open(filename, 'w') as html_file:
+            html_file.write(pio.to_html(fig, include_plotlyjs='cdn'))
+    else:
+        fig.show()
+    return fig
+
+
+# Dimension of the current OpenSees model, kept in sync by start_model
+# so create_nodes knows how many coordinates to marshal per node.
+_model_ndm = 3
+
+
+def start_model(ndm=3, ndf=6):
+    """Wipe any previous OpenSees model and start a new one."""
+    global _model_ndm
+    if ops is None:
+        raise ImportError('openseespy is required for start_model')
+    ops.wipe()
+    ops.model('basic', '-ndm', ndm, '-ndf', ndf)
+    _model_ndm = ndm
+
+
+def create_nodes(nodes):
+    """Create an OpenSees node for every entry of ``nodes``."""
+    if ops is None:
+        raise ImportError('openseespy is required for create_nodes')
+    # OpenSeesPy offers no batched node command, so one boundary
+    # crossing per node is the floor; prepare all the positional
+    # arguments first so the call loop does nothing but call, and skip
+    # the z coordinate entirely for 2D models.
+    node = ops.node
+    if _model_ndm == 2:
+        args = [(int(n), float(v.coord[0]), float(v.coord[1]))
+                for n, v in nodes.items()]
+        for n, x, y in args:
+            node(n, x, y)
+    else:
+        args = [(int(n), float(v.coord[0]), float(v.coord[1]),
+                 float(v.coord[2]))
+                for n, v in nodes.items()]
+        for n, x, y, z in args:
+            node(n, x, y, z)
+
+
+def material_tester(mat_tag, strain, scale_stress=1.0):
+    """Run a strain sweep on a uniaxial material and plot the response.
+
+    The material ``mat_tag`` must already be defined in the current
+    OpenSees model.  ``strain`` is the list of strain values to impose;
+    stresses are divided by ``scale_stress`` before plotting.
+    """
+    if ops is None:
+        raise ImportError('openseespy is required for material_tester')
+
+    ops.testUniaxialMaterial(mat_tag)
+    stress = np.empty(len(strain))
+    for i, eps in enumerate(strain):
+        ops.setStrain(eps)
+        stress[i] = ops.getStress()
+    stress /= scale_stress
+
+    fig, ax = plt.subplots()
+    ax.plot(strain, stress)
+    ax.set_xlabel('Strain')
+    ax.set_ylabel('Stress')
+    ax.grid(True)
+    plt.show()
+    return fig, ax